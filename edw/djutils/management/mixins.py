@@ -23,6 +23,8 @@ class ProgressMixin(object):
 
     def __init__(self, *args, **kwargs):
         self.no_progress = False
+        self._progress_last = None
+        self._progress_cache = {}
         super(ProgressMixin, self).__init__(*args, **kwargs)
 
     def add_arguments(self, parser):
@@ -41,14 +43,29 @@ class ProgressMixin(object):
         if self.no_progress:
             return
 
-        percentage = int(float(x) / total * 100)
+        percentage = x * 100 // total
 
-        out = self.get_progress_format(total).format(
+        # stderr is unbuffered, so only redraw when the output would change
+        # (the extra format kwargs included)
+        state = (total, percentage, kwargs)
+        if self._progress_last == state:
+            return
+        self._progress_last = state
+
+        try:
+            fmt = self._progress_cache[total]
+        except KeyError:
+            fmt = self._progress_cache[total] = self.get_progress_format(total)
+
+        out = fmt.format(
             item=x, total=total, percentage=percentage, **kwargs)
 
-        sys.stderr.write("\r%s%s%s" % (
-            self.PROGRESS_PREFIX, out, self.PROGRESS_SUFFIX))
+        # this is the end.. right?
+        end = '\n' if percentage == 100 else ''
+
+        sys.stderr.write("\r%s%s%s%s" % (
+            self.PROGRESS_PREFIX, out, self.PROGRESS_SUFFIX, end))
 
-        if percentage == 100:
-            # this is the end.. right?
-            sys.stderr.write('\n')
+        if end:
+            # the next loop starts fresh
+            self._progress_last = None
@@ -1,4 +1,3 @@
-import os.path
 from ..urlresolvers import wild_reverse
 from django.db.models.fields.files import (
     FileField, ImageField, FieldFile, ImageFieldFile,
@@ -13,7 +12,7 @@ class ProtectedFieldFile(FieldFile):
         if self.field.view is not None:
             return wild_reverse(self.field.view,
                                 kwargs={'pk': self.instance.pk,
-                                        'filename': os.path.basename(self.name),
+                                        'filename': self.name.rpartition('/')[2],
                                         'filepath': self.name})
         else:
             return getattr(self.instance,
@@ -22,7 +21,7 @@ class ProtectedFieldFile(FieldFile):
     @property
     def filename(self):
         self._require_file()
-        return os.path.basename(self.name)
+        return self.name.rpartition('/')[2]
 
 
 class ProtectedImageFieldFile(ProtectedFieldFile, ImageFieldFile):
@@ -1,5 +1,7 @@
 from django.conf import settings
 from django.core.files.storage import FileSystemStorage
+from django.test.signals import setting_changed
+from django.dispatch import receiver
 from django.utils.functional import LazyObject
 from django.utils.deconstruct import deconstructible
 
@@ -11,12 +13,27 @@ from django.utils.deconstruct import deconstructible
 
 @deconstructible
 class ProtectedFileSystemStorage(FileSystemStorage):
+    # (PROTECTED_ROOT, PROTECTED_URL), read once on first instantiation
+    _defaults = None
+
     def __init__(self, *args, **kwargs):
-        kwargs.setdefault('location', settings.PROTECTED_ROOT)
-        kwargs.setdefault('base_url', settings.PROTECTED_URL)
+        defaults = ProtectedFileSystemStorage._defaults
+        if defaults is None:
+            defaults = (settings.PROTECTED_ROOT, settings.PROTECTED_URL)
+            ProtectedFileSystemStorage._defaults = defaults
+
+        location, base_url = defaults
+        kwargs.setdefault('location', location)
+        kwargs.setdefault('base_url', base_url)
         super().__init__(*args, **kwargs)
 
 
+@receiver(setting_changed)
+def _reset_protected_defaults(setting, **kwargs):
+    if setting in ('PROTECTED_ROOT', 'PROTECTED_URL'):
+        ProtectedFileSystemStorage._defaults = None
+
+
 class ProtectedStorage(LazyObject):
     def _setup(self):
         self._wrapped = ProtectedFileSystemStorage()
@@ -1,12 +1,15 @@
-import os.path
+import threading
 import warnings
 from functools import wraps
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured, PermissionDenied
+from django.core.urlresolvers import get_script_prefix, get_urlconf
 from django.http.response import (
     HttpResponse, HttpResponseNotFound, HttpResponseForbidden,
+    HttpResponseRedirect,
 )
-from django.shortcuts import redirect
+from django.shortcuts import resolve_url
+from django.utils.translation import get_language
 from django.views.generic.base import View, TemplateView
 from django.views.generic.detail import SingleObjectMixin, DetailView
 from django.views.generic.list import ListView
@@ -17,24 +20,24 @@ from django.views.generic.edit import (
 from django.views.static import serve as serve_file
 
 
+# ids of the views currently dispatching with permissions already checked
+_check_ctx = threading.local()
+
+
 class ProtectedViewBase(type):
     def __new__(cls, name, bases, attrs):
         """ wraps the topmost dispatch() in check_permissions()"""
 
-        try:
-            dispatcher = attrs.pop('dispatch')
-        except KeyError:
+        dispatcher = attrs.get('dispatch')
+        if dispatcher is None:
             dispatcher = next(base.dispatch for base in bases
-                             if hasattr(base, 'dispatch'))
+                              if hasattr(base, 'dispatch'))
 
-        try:
-            # if the first match is our own method, there's nothing to do
-            dispatcher._checks_permissions
-        except AttributeError:
+        # if the first match is our own method, there's nothing to do
+        if not hasattr(dispatcher, '_checks_permissions'):
             dispatcher = cls._permission_wrapper(dispatcher)
             dispatcher._checks_permissions = None
-
-        attrs['dispatch'] = dispatcher
+            attrs['dispatch'] = dispatcher
 
         return super().__new__(cls, name, bases, attrs)
 
@@ -42,15 +45,24 @@ class ProtectedViewBase(type):
     def _permission_wrapper(dispatch):
         @wraps(dispatch)
         def wrapper(self, request, *args, **kwargs):
-            # avoid an endless loop in case of diamond inheritance
-            permissions_checked = getattr(self, '_permissions_checked', False)
-            if not permissions_checked:
-                self._permissions_checked = True
+            try:
+                seen = _check_ctx.seen
+            except AttributeError:
+                seen = _check_ctx.seen = set()
 
-            if permissions_checked or self.check_permissions(request):
+            # avoid an endless loop in case of diamond inheritance
+            key = id(self)
+            if key in seen:
                 return dispatch(self, request, *args, **kwargs)
-            else:
+
+            seen.add(key)
+            try:
+                if self.check_permissions(request):
+                    return dispatch(self, request, *args, **kwargs)
+
                 return self.permission_denied(request)
+            finally:
+                seen.discard(key)
 
         return wrapper
 
@@ -66,26 +78,66 @@ class ProtectedView(View, metaclass=ProtectedViewBase):
 
     def get_permissions(self):
         try:
-            self.__permissions
+            return self.__permissions
         except AttributeError:
-            self.__permissions = [permission()
-                                  for permission in self.permission_classes]
-            if not self.__permissions:
+            pass
+
+        # permissions are stateless, so they're instantiated once per class,
+        # unless permission_classes is overridden per instance (e.g. through
+        # as_view()) or isn't a plain sequence (e.g. a property)
+        cls = type(self)
+        declared = next(vars(klass)['permission_classes']
+                        for klass in cls.__mro__
+                        if 'permission_classes' in vars(klass))
+        cacheable = ('permission_classes' not in self.__dict__ and
+                     isinstance(declared, (list, tuple)))
+
+        permissions = (cls.__dict__.get('_permission_instances')
+                       if cacheable else None)
+        if permissions is None:
+            permissions = [permission()
+                           for permission in self.permission_classes]
+            if not permissions:
                 warnings.warn("View %s "
-                              "has empty permissions." % type(self).__name__,
+                              "has empty permissions." % cls.__name__,
                               stacklevel=2)
 
-        return self.__permissions
+            if cacheable:
+                cls._permission_instances = permissions
+
+        self.__permissions = permissions
+        return permissions
 
     def check_permissions(self, request):
+        permissions = self.get_permissions()
+
+        # spare the generator for the common single permission case
+        # (overrides may return any iterable)
+        if isinstance(permissions, (list, tuple)) and len(permissions) == 1:
+            return permissions[0].has_permission(request, self)
+
         return all(
             permission.has_permission(request, self)
-            for permission in self.get_permissions()
+            for permission in permissions
         )
 
     def permission_denied(self, request):
-        if self.permission_denied_redirect:
-            return redirect(self.permission_denied_redirect)
+        target = self.permission_denied_redirect
+        if target:
+            # resolving may involve reverse(), so cache it per class and
+            # everything reverse() depends on
+            cls = type(self)
+            try:
+                cache = cls.__dict__['_denied_redirects']
+            except KeyError:
+                cache = cls._denied_redirects = {}
+
+            key = (target, get_script_prefix(), get_urlconf(), get_language())
+            try:
+                url = cache[key]
+            except KeyError:
+                url = cache[key] = resolve_url(target)
+            return HttpResponseRedirect(url)
 
         raise PermissionDenied()
 
@@ -94,7 +146,20 @@ class ProtectedObjectMixin(object):
     """
     A mixin running permissions' `has_object_permission()` against views
     with a `get_object()` method.
+
+    The object is fetched once per request and shared between the permission
+    check and the view itself.
     """
+    def get_object(self, queryset=None):
+        if queryset is not None:
+            return super().get_object(queryset)
+
+        try:
+            return self.__object
+        except AttributeError:
+            self.__object = super().get_object()
+            return self.__object
+
     def check_permissions(self, request):
         if not super().check_permissions(request):
             return False
@@ -225,6 +290,7 @@ class ProtectedFileView(ProtectedView):
         return self.get_storage().url(self.get_file_path())
 
     def get(self, request, *args, **kwargs):
+        # this can only be checked here, url kwargs aren't known earlier
         if 'filename' in kwargs and 'filepath' in kwargs:
             raise ImproperlyConfigured(
                 "%s: 'filename' and 'filepath' view kwargs "
@@ -235,10 +301,10 @@ class ProtectedFileView(ProtectedView):
         if relpath is None or relpath == '':
             return HttpResponseNotFound()
 
-        basename = os.path.basename(relpath)
+        basename = relpath.rpartition('/')[2]
 
-        if ('filename' in kwargs and kwargs['filename'] != basename) or \
-           ('filepath' in kwargs and kwargs['filepath'] != self.get_file_path()):
+        if (kwargs.get('filename', basename) != basename or
+                kwargs.get('filepath', relpath) != relpath):
             return HttpResponseNotFound()
 
         if settings.DEBUG:
@@ -257,7 +323,7 @@ class ProtectedFileView(ProtectedView):
 
         if self.content_disposition:
             response['Content-Disposition'
-                     ] = '{}; filename={};"'.format(self.content_disposition,
+                     ] = '{}; filename="{}"'.format(self.content_disposition,
                                                     basename)
 
         return response
@@ -293,15 +359,24 @@ class ProtectedDetailFileView(ProtectedBaseDetailFileView):
                 "You need to define %s.file_field." % type(self).__name__)
 
     def get_queryset(self):
-        return super().get_queryset(
-            ).select_related(None).prefetch_related(None).only(self.file_field)
+        queryset = super().get_queryset()
+
+        # only clone when there's actually something to strip
+        if queryset.query.select_related:
+            queryset = queryset.select_related(None)
+        if queryset._prefetch_related_lookups:
+            queryset = queryset.prefetch_related(None)
+
+        return queryset.only(self.file_field)
 
     def _get_file(self):
         """ returns a `django.db.models.fields.files.FieldFile` instance """
         return getattr(self.get_object(), self.file_field)
 
     def get_storage(self):
-        return self._get_file().storage
+        # the storage belongs to the field, no instance needed
+        model = self.model or self.get_queryset().model
+        return model._meta.get_field(self.file_field).storage
 
     def get_file_path(self):
         return self._get_file().name
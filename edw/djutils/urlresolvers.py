@@ -1,25 +1,90 @@
-from django.utils import six
-from django.utils.encoding import force_text, iri_to_uri
+from functools import lru_cache
+from django.utils.encoding import iri_to_uri
+from django.utils.translation import get_language
 from django.core.urlresolvers import (
-    get_resolver, get_ns_resolver, get_script_prefix, get_urlconf,
-    NoReverseMatch,
+    get_callable, get_resolver, get_ns_resolver, get_script_prefix,
+    get_urlconf, NoReverseMatch,
 )
 
 
+def _no_match(lookup_view, kwargs):
+    m = getattr(lookup_view, '__module__', None)
+    n = getattr(lookup_view, '__name__', None)
+    if m is not None and n is not None:
+        lookup_view_s = "%s.%s" % (m, n)
+    else:
+        lookup_view_s = lookup_view
+
+    return NoReverseMatch("Reverse for '%s' with wild keyword arguments "
+                          "'%s' not found." % (lookup_view_s, kwargs))
+
+
+@lru_cache(maxsize=256)
+def _get_params(resolver, view, language):
+    """
+    Returns `(lookup_view, params)`, with `params` being the url parameters
+    of view's pattern, or None if there's no such pattern.
+
+    `language` is only part of the cache key: `reverse_dict` is per language.
+    """
+    if not resolver._populated:
+        resolver._populate()
+
+    lookup_view = view
+    try:
+        if resolver._is_callback(lookup_view):
+            lookup_view = get_callable(lookup_view, True)
+    except (ImportError, AttributeError) as e:
+        raise NoReverseMatch("Error importing '%s': %s." % (lookup_view, e))
+
+    try:
+        # note: this doesn't cover the possibility of multiple patterns returned
+        return lookup_view, resolver.reverse_dict[lookup_view][0][0][1]
+    except KeyError:
+        return lookup_view, None
+
+
 def wild_reverse(viewname, kwargs, urlconf=None, current_app=None):
     """
     Returns the reverse url using as many of the given kwargs as possible.
-    """
 
-    # copy/paste from django.core.urlresolvers.reverse
+    Results are cached; kwargs with unhashable values bypass the cache.
+    Note that the cache holds on to the kwargs values (e.g. model instances)
+    of up to 4096 calls.
+    """
 
     if urlconf is None:
         urlconf = get_urlconf()
+    # a reloaded urlconf gets a new resolver, and thus new cache entries
     resolver = get_resolver(urlconf)
-
     prefix = get_script_prefix()
+    # i18n_patterns and translated patterns reverse differently per language
+    language = get_language()
+
+    # equal values can stringify differently (1, 1.0, True), so the type
+    # is part of the key too
+    kwargs_items = tuple((k, type(v), v) for k, v in sorted(kwargs.items()))
+    try:
+        hash(kwargs_items)
+    except TypeError:
+        return _wild_reverse(viewname, kwargs, resolver, prefix, language,
+                             current_app)
+
+    return _cached_wild_reverse(viewname, kwargs_items,
+                                resolver, prefix, language, current_app)
+
 
-    if not isinstance(viewname, six.string_types):
+@lru_cache(maxsize=4096)
+def _cached_wild_reverse(viewname, kwargs_items,
+                         resolver, prefix, language, current_app):
+    return _wild_reverse(viewname, {k: v for k, _, v in kwargs_items},
+                         resolver, prefix, language, current_app)
+
+
+def _wild_reverse(viewname, kwargs, resolver, prefix, language, current_app):
+    # copy/paste from django.core.urlresolvers.reverse
+
+    if not isinstance(viewname, str):
         view = viewname
     else:
         parts = viewname.split(':')
@@ -78,35 +143,19 @@ def wild_reverse(viewname, kwargs, urlconf=None, current_app=None):
     # this part adapted from
     # django.core.urlresolvers.RegexURLResolver._reverse_with_prefix
 
-    text_kwargs = {k: force_text(v) for (k, v) in kwargs.items()}
-
-    if not resolver._populated:
-        resolver._populate()
+    lookup_view, params = _get_params(resolver, view, language)
+    if params is None:
+        raise _no_match(lookup_view, kwargs)
 
-    original_lookup = lookup_view = view
     try:
-        if resolver._is_callback(lookup_view):
-            lookup_view = get_callable(lookup_view, True)
-    except (ImportError, AttributeError) as e:
-        raise NoReverseMatch("Error importing '%s': %s." % (lookup_view, e))
-
-    try:
-        # note: this doesn't cover the possibility of multiple patterns returned
-        params = resolver.reverse_dict[lookup_view][0][0][1]
-        ok_kwargs = dict(((param, kwargs[param]) for param in params))
+        # only stringify what the pattern actually uses
+        ok_kwargs = {param: kwargs[param] if isinstance(kwargs[param], str)
+                     else str(kwargs[param])
+                     for param in params}
     except KeyError:
-        # this covers both statements above
-        m = getattr(lookup_view, '__module__', None)
-        n = getattr(lookup_view, '__name__', None)
-        if m is not None and n is not None:
-            lookup_view_s = "%s.%s" % (m, n)
-        else:
-            lookup_view_s = lookup_view
-
-        raise NoReverseMatch("Reverse for '%s' with wild keyword arguments "
-                             "'%s' not found." % (lookup_view_s, kwargs))
+        raise _no_match(view, kwargs)
 
     # /end adaptation
 
-    return force_text(iri_to_uri(
-        resolver._reverse_with_prefix(view, prefix, **ok_kwargs)))
+    return iri_to_uri(
+        resolver._reverse_with_prefix(view, prefix, **ok_kwargs))